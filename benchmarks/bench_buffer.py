@@ -0,0 +1,43 @@
+"""Microbenchmark do custo de controle do `Buffer` por frame consumido.
+
+Simula o laço de `VideoBufferRight.get` (do_task, unqueue, get, do_task) sobre
+um `BufferRight` previamente cheio, de modo que somente o custo do plano de
+controle (flags, locks e sincronização) é medido, sem decodificação.
+
+Uso:
+    python benchmarks/bench_buffer.py [--frames N] [--repeat R]
+"""
+
+from argparse import ArgumentParser
+from threading import Semaphore
+from time import perf_counter
+
+from gplayer.buffer import BufferRight
+
+
+def bench_get(frames: int) -> float:
+    """Retorna o tempo médio, em microssegundos, do ciclo de controle de um `get`."""
+    buffer = BufferRight(Semaphore(), maxsize=frames)
+    buffer._primary.extend((frame_id, None) for frame_id in range(frames))
+
+    start = perf_counter()
+    for _ in range(frames):
+        buffer.do_task()
+        buffer.unqueue()
+        buffer.get()
+        buffer.do_task()
+    return (perf_counter() - start) / frames * 1e6
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    best = min(bench_get(args.frames) for _ in range(args.repeat))
+    print(f'per-get control overhead: {best:.3f} us ({args.frames} frames, best of {args.repeat})')
+
+
+if __name__ == '__main__':
+    main()
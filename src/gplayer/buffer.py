@@ -5,7 +5,10 @@ estár sempre cheio, para isso temos os seguintes atributos e métodos.
 class Buffer:
     -_primary: É um deque que define o buffer primario.
     -_secondary: É uma Queue que define o buffer segundario.
+    -_state: Estado da task (IDLE, FILLING, DRAINING ou CANCELLED), protegido por uma única Condition.
 
+    +cancel() None: Solicita o cancelamento da task em andamento.
+    +cancelled() bool: Verifica se o cancelamento da task foi solicitado.
     +no_block_task() bool: Método para bloquear a task
     +clear() bool: Método para se chamado dentro da task para liberar os recursos de controle do Buffer.
     +empty() bool: Retorna True se o buffer primario estiver vazio.
@@ -13,6 +16,7 @@ class Buffer:
     +get() any: Retorna o valor armazenado no Buffer
     +put() None: Coloca um dado no buffer primario manualmente.
     +secondary_empty() bool: Retorna True se o buffer segundario estiver vazio.
+    +send() None: Envia os dados da task para a thread.
     +set() bool: Método para ser chamado dentro da task, seta recurso para o controle do Buffer.
     +sput() bool: Método para armazenar o dado no buffer segundaroi.
     +task_is_done() bool: Verifica se a tarefa esta concluida.
@@ -25,6 +29,7 @@ class FakeBuffer(Buffer):
 
 
 class BufferRight(Buffer):
+    +stream() None: Método que passa os frames já lidos para o buffer primario sem esperar a task.
     +unqueue() None: Método que faz a transferencia dos valores armazenados no buffer segundario
         para o buffer primario
 
@@ -37,11 +42,20 @@ class BufferLeft(Buffer):
 
 from abc import ABC, abstractmethod
 from collections import deque
+from enum import Enum
 from loguru import logger
 from queue import Queue
 from gplayer.channel import Channel1
 from gplayer.custom_exceptions import VideoBufferError
-from threading import Event, Lock, Semaphore
+from threading import Condition, Semaphore
+
+
+class BufferState(Enum):
+    """Estados da task responsável por encher o buffer segundario."""
+    IDLE = 'idle'
+    FILLING = 'filling'
+    DRAINING = 'draining'
+    CANCELLED = 'cancelled'
 
 
 class Buffer(ABC, Channel1):
@@ -53,19 +67,20 @@ class Buffer(ABC, Channel1):
         self._primary = deque(list(), maxlen=maxsize)
         self._secondary = Queue(maxsize=maxsize)
         self.__block_task = True
-        self.lock = Lock()
         self.semaphore = semaphore
-        self.event = Event()
-        self.end_task = Event()
 
         # Queue para o envio de possíveis erros que venham a ocorrer na thread
         self._error = Queue()
 
-        self.__task = Queue(maxsize=1)
-        self._wait_task = Queue(maxsize=1)
-        self._end_task = Queue(maxsize=1)
-        self.__task.put_nowait(True)
-        self._wait_task.put_nowait(True)
+        # Todo o plano de controle da task é uma máquina de estados protegida por
+        # uma única Condition, as escritas são feitas com a Condition adquirida e
+        # as leituras do estado dispensam o lock, já que a atribuição é atômica.
+        # O _pending conta as tasks enviadas que ainda não foram iniciadas pela
+        # thread, e o _started é usado pelo synchronizing_main_thread.
+        self._condition = Condition()
+        self._state = BufferState.IDLE
+        self._pending = 0
+        self._started = 0
 
     def __getitem__(self, index: int) -> int:
         return self._primary[index][0]
@@ -98,16 +113,28 @@ class Buffer(ABC, Channel1):
         """
 
         logger.debug('starting process to clear secondary buffer')
-        # Matamos a task antes de limpar a queue, para isso enviamos False
+        # Matamos a task antes de limpar a queue
         if not self.task_is_done():
             logger.debug('terminating the task in the thread')
-            self.end_task.set()
+            self.cancel()
 
         # Devemos descarregar o buffer secondary no primary antes de limpa-lo
         self.unqueue()
         logger.debug('unloading the secondary buffer')
         while self.secondary_empty() is False:
             self._secondary.get_nowait()
+        self._drained()
+
+    def _drained(self) -> None:
+        """Volta para o estado IDLE após o buffer segundario ser descarregado."""
+        if self._state is BufferState.DRAINING:
+            with self._condition:
+                if self._state is BufferState.DRAINING and self.secondary_empty():
+                    self._state = BufferState.IDLE
+
+    @property
+    def state(self) -> BufferState:
+        return self._state
 
     def wait_task(self):
         """
@@ -117,8 +144,45 @@ class Buffer(ABC, Channel1):
             None
         """
         if self.task_is_done() is False:
-            value = self._wait_task.get()
-            self._wait_task.put(value)
+            with self._condition:
+                self._condition.wait_for(self.task_is_done)
+
+    def cancel(self) -> None:
+        """
+        Solicita o cancelamento da task em andamento, a task é encerrada na próxima
+        verificação feita pelo `reader_task`, caso nenhuma task esteja em andamento
+        nada é feito.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            if self._state is BufferState.FILLING:
+                self._state = BufferState.CANCELLED
+
+    def cancelled(self) -> bool:
+        """
+        Verifica se o cancelamento da task foi solicitado.
+
+        Returns:
+            bool
+        """
+        return self._state is BufferState.CANCELLED
+
+    def send(self, data: any) -> None:
+        """
+        Envia os dados para a thread, contabilizando as tasks que ainda não foram iniciadas.
+
+        Args:
+            data any: os dados a serem enviados.
+
+        Returns:
+            None
+        """
+        if hasattr(data, '__contains__'):
+            with self._condition:
+                self._pending += 1
+        super().send(data)
 
     def do_task(self):
         """
@@ -156,6 +220,10 @@ class Buffer(ABC, Channel1):
         """
         self._secondary.put(value)
 
+        # Acorda o consumidor que esteja esperando pelo próximo frame no modo streaming
+        with self._condition:
+            self._condition.notify_all()
+
     def set(self) -> None:
         """
         Método para setar atributos que tem relação com inicio da task
@@ -165,10 +233,11 @@ class Buffer(ABC, Channel1):
         """
         logger.debug('setting synchronization and task control variables with threads')
         self.semaphore.acquire()
-        self.task_is_done(False)
-        self._wait_task.get()
-        self.event.set()
-        self.end_task.clear()
+        with self._condition:
+            self._state = BufferState.FILLING
+            self._pending = max(self._pending - 1, 0)
+            self._started += 1
+            self._condition.notify_all()
 
     def clear(self) -> None:
         """
@@ -179,10 +248,9 @@ class Buffer(ABC, Channel1):
         """
         logger.debug('unsetting synchronization and task control variables with threads')
         self.semaphore.release()
-        self.task_is_done(True)
-        self._wait_task.put(True)
-        self.event.clear()
-        self.end_task.set()
+        with self._condition:
+            self._state = BufferState.IDLE if self.secondary_empty() else BufferState.DRAINING
+            self._condition.notify_all()
 
     def synchronizing_main_thread(self) -> None:
         """
@@ -193,31 +261,25 @@ class Buffer(ABC, Channel1):
         pode tentar acessar essas variáveis antes de serem devidamente configuradas, o que pode
         resultar em um comportamento inesperado no programa.
 
-        O método `synchronizing_main_thread` usa um evento (`Event`) para forçar a thread principal
-        a aguardar até que a atualização das variáveis de controle esteja concluída, garantindo
-        a consistência do estado do buffer.
+        O método `synchronizing_main_thread` usa a `Condition` do buffer para forçar a thread
+        principal a aguardar até que todas as tasks enviadas tenham sido iniciadas, garantindo
+        a consistência do estado do buffer, mesmo que a task já tenha sido concluida.
 
         Returns:
             None
         """
         logger.debug('synchronizing main thread')
-        self.event.wait()
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending == 0 and self._started > 0)
 
-    def task_is_done(self, value: bool = None) -> bool:
+    def task_is_done(self) -> bool:
         """
         Verifica se o ciclo para encher o buffer secundary foi concluido.
 
         Returns:
             bool
         """
-        with self.lock:
-            task_is_done = self.__task.get_nowait()
-            if isinstance(value, bool):
-                logger.debug(f'setting task_is_done to {value}')
-                self.__task.put_nowait(value)
-            else:
-                self.__task.put_nowait(task_is_done)
-        return task_is_done
+        return self._state is not BufferState.FILLING and self._state is not BufferState.CANCELLED
 
     def secondary_empty(self) -> bool:
         """
@@ -301,6 +363,23 @@ class BufferRight(Buffer):
             while not self.secondary_empty():
                 value = self._secondary.get()
                 self._primary.append(value)
+            self._drained()
+
+    def stream(self) -> None:
+        """
+        Método para passar os frames já lidos do buffer segundario para o primario,
+        sem esperar que a task seja concluida. Só há bloqueio quando o buffer primario
+        estiver vazio e a task ainda não tiver produzido o próximo frame.
+
+        Returns:
+            None
+        """
+        if self.empty():
+            with self._condition:
+                self._condition.wait_for(lambda: not self.secondary_empty() or self.task_is_done())
+        while len(self._primary) < self.maxsize and not self.secondary_empty():
+            self._primary.append(self._secondary.get_nowait())
+        self._drained()
 
 
 class BufferLeft(Buffer):
@@ -320,6 +399,7 @@ class BufferLeft(Buffer):
             while not self.secondary_empty():
                 value = self._secondary.get()
                 self._primary.appendleft(value)
+            self._drained()
 
 
 class FakeBuffer(BufferRight):
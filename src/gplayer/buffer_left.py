@@ -24,6 +24,7 @@ from numpy import ndarray
 from gplayer.buffer import BufferLeft
 from gplayer.custom_exceptions import VideoBufferError
 from gplayer.frame_mapper import FrameMapper
+from gplayer.keyframe import KeyframeIndex
 from gplayer.reader import reader
 from gplayer.interfaces import IVideoBuffer
 from threading import Semaphore, Thread
@@ -43,6 +44,7 @@ class VideoBufferLeft(IVideoBuffer):
                  semaphore: Semaphore, *,
                  buffersize=25,
                  bufferlog=False,
+                 keyframes: KeyframeIndex = None,
                  name='buffer'):
 
         # Definições das variaveis que lidam com o Thread
@@ -51,6 +53,7 @@ class VideoBufferLeft(IVideoBuffer):
         self._frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
         self.name = name
         self.buffersize = buffersize
+        self.keyframes = keyframes
         self._buffer = BufferLeft(semaphore, maxsize=buffersize, log=bufferlog)
 
         # Definições das variaveis responsavel pela criação do buffer
@@ -150,6 +153,38 @@ class VideoBufferLeft(IVideoBuffer):
         else:
             self.__set_end_frame = frame_ids[idx - 1]
 
+        return self.__align_gop(frame_id, temp_idx)
+
+    def __align_gop(self, frame_id: int, end_idx: int) -> int:
+        """
+        Alinha o start_frame com o primeiro keyframe do intervalo [start_frame, end_frame).
+
+        Como o VideoBufferLeft percorre o vídeo de trás para frente, iniciar cada ciclo
+        em um keyframe faz com que o ciclo seguinte termine exatamente antes do mesmo,
+        assim cada GOP é decodificado uma única vez durante o rewind, e o `reader_task`
+        não precisa decodificar frames que seriam descartados. Quando o GOP é maior que
+        o buffer não existe keyframe no intervalo e o start_frame é mantido.
+
+        Args:
+            frame_id (int): start_frame calculado a partir do buffersize.
+            end_idx (int): índice no mapping do frame a direita do end_frame.
+
+        Returns:
+            int: start_frame alinhado com o GOP.
+        """
+        if self.keyframes is None or end_idx < 1:
+            return frame_id
+
+        frame_ids = self.__mapping.frame_ids
+        end_frame = frame_ids[end_idx - 1]
+        keyframe = self.keyframes.next_keyframe(frame_id)
+        if keyframe is None or keyframe >= end_frame:
+            return frame_id
+
+        start_frame = frame_ids[bisect.bisect_left(frame_ids, keyframe)]
+        if start_frame < end_frame:
+            logger.debug(f'start_frame {frame_id} aligned with the keyframe {keyframe}')
+            return start_frame
         return frame_id
 
     def is_task_complete(self) -> bool:
@@ -267,7 +302,7 @@ class VideoBufferLeft(IVideoBuffer):
                 end_frame = self.__special_case
 
             mapping = self.__mapping.get_mapping()
-            values = (self.cap, start_frame, end_frame, mapping)
+            values = (self.cap, start_frame, end_frame, mapping, self.keyframes)
 
             # O método send deve ser usado somente em 2 casos:
             #   1o. Para enviar os dados para a thread
@@ -299,7 +334,7 @@ class VideoBufferLeft(IVideoBuffer):
         """
 
         # Caso a thread esteja fazendo uma task, devemos encerrá-la
-        self._buffer.end_task.set()
+        self._buffer.cancel()
         self._buffer.send(False)
         self.thread.join()
         if self.cap is not None:
@@ -312,7 +347,7 @@ class VideoBufferLeft(IVideoBuffer):
         Returns:
             None
         """
-        self._buffer.end_task.set()
+        self._buffer.cancel()
         self._buffer.send(False)
         self.thread.join()
 
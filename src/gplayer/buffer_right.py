@@ -13,6 +13,8 @@ módulo da opencv, a mesma tem a seguinte estrutura:
         -_start_frame: inteiro que armazenao o id do primeiro frame a ser lido
         +parent_conn: pipe para comunicação com o processo descrito acima
         +child_conn: pipe passado para o processo descrito acima
+        +streaming: bool que ativa o modo em que o buffer é abastecido continuamente.
+        +low_watermark: inteiro que determina quando uma nova task deve ser iniciada no modo streaming.
 
         +start_frame() int: metodo que retorna o id do primeiro frame a ser lido
 
@@ -24,6 +26,7 @@ from loguru import logger
 from numpy import ndarray
 from gplayer.buffer import BufferRight
 from gplayer.frame_mapper import FrameMapper
+from gplayer.keyframe import KeyframeIndex
 from gplayer.reader import reader
 from gplayer.interfaces import IVideoBuffer
 from gplayer.custom_exceptions import VideoBufferError
@@ -41,6 +44,9 @@ class VideoBufferRight(IVideoBuffer):
                  semaphore: Semaphore, *,
                  buffersize=25,
                  bufferlog=False,
+                 keyframes: KeyframeIndex = None,
+                 streaming: bool = False,
+                 low_watermark: int = None,
                  name='buffer',
                  timeout: int = 1):
 
@@ -50,8 +56,15 @@ class VideoBufferRight(IVideoBuffer):
         self._frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
         self.name = name
         self.buffersize = buffersize
+        self.keyframes = keyframes
         self._buffer = BufferRight(semaphore, maxsize=buffersize, log=bufferlog)
 
+        # No modo streaming a thread é acionada sempre que o buffer primario atinge o
+        # low_watermark, e os frames lidos são consumidos à medida que são produzidos,
+        # mantendo o buffer abastecido em segundo plano.
+        self.streaming = streaming
+        self.low_watermark = buffersize // 2 if low_watermark is None else low_watermark
+
         # Definições das variaveis responsavel pela criação do buffer
         self.__frame_id = None
         self._set_frame = None
@@ -166,6 +179,8 @@ class VideoBufferRight(IVideoBuffer):
         Returns:
             bool
         """
+        if self.streaming and len(self._buffer) > self.low_watermark:
+            return False
         return self._buffer.do_task() and self.is_done() is False
 
     def set_frame_id(self):
@@ -242,7 +257,7 @@ class VideoBufferRight(IVideoBuffer):
             logger.debug(f"start_frame set {start_frame}, end_frame set {end_frame}")
 
             mapping = self.__mapping.get_mapping()
-            values = (self.cap, start_frame, end_frame, mapping)
+            values = (self.cap, start_frame, end_frame, mapping, self.keyframes)
 
             # O método send deve ser usado somente em 2 casos:
             #   1o. Para enviar os dados para a thread
@@ -260,7 +275,7 @@ class VideoBufferRight(IVideoBuffer):
 
     def join(self) -> None:
         # Caso a thread esteja fazendo uma task, devemos encerrá-la
-        self._buffer.end_task.set()
+        self._buffer.cancel()
         self._buffer.send(False)
         self.thread.join()
         if self.cap is not None:
@@ -273,7 +288,7 @@ class VideoBufferRight(IVideoBuffer):
         Returns:
             None
         """
-        self._buffer.end_task.set()
+        self._buffer.cancel()
         self._buffer.send(False)
         self.thread.join()
 
@@ -306,7 +321,10 @@ class VideoBufferRight(IVideoBuffer):
     def get(self) -> tuple[int, ndarray | None]:
         logger.debug("iniciativa de obtenção do frame")
         self.run()
-        self._buffer.unqueue()
+        if self.streaming:
+            self._buffer.stream()
+        else:
+            self._buffer.unqueue()
         frame_id, frame = self._buffer.get()
         self.__frame_id = frame_id
         logger.debug(f"frame de id '{frame_id}' lido com sucesso!")
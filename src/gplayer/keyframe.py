@@ -0,0 +1,194 @@
+"""Este módulo fornece o índice de keyframes (GOP) de um vídeo.
+
+O `KeyframeIndex` é construído uma única vez, percorrendo os pacotes do vídeo
+sem decodificá-los, e fica armazenado em cache ao lado do arquivo `.json` das
+seções. Com ele o `reader_task` consegue planejar cada ciclo de leitura a partir
+do keyframe mais próximo à esquerda do frame inicial, limitando o custo de
+decodificação de qualquer seek.
+
+    class KeyframeIndex:
+        +keyframes: array com os ids dos keyframes em ordem crescente.
+        +frame_count: número de frames da mídia.
+
+        +keyframe() int: keyframe mais próximo à esquerda de um frame_id.
+        +next_keyframe() int | None: keyframe mais próximo à direita de um frame_id.
+        +same_gop() bool: verifica se dois frames pertencem ao mesmo GOP.
+        +seek_plan() tuple[int | None, int]: planeja o reposicionamento do VideoCapture.
+"""
+
+
+from array import array
+from cv2 import VideoCapture
+from loguru import logger
+from pathlib import Path
+from gplayer.readers import JSONReader, JSONWriter
+
+import bisect
+import cv2
+
+
+class KeyframeIndex:
+    """Classe que implementa um índice ordenado dos keyframes de um vídeo."""
+
+    def __init__(self, keyframes: list[int], frame_count: int) -> None:
+        self.__frame_count = frame_count
+        frame_ids = sorted(set(frame_id for frame_id in keyframes if 0 <= frame_id < frame_count))
+
+        # O primeiro frame de um vídeo é sempre decodificável sem referências
+        # anteriores, portanto deve sempre ser tratado como keyframe.
+        if frame_count > 0 and (len(frame_ids) == 0 or frame_ids[0] != 0):
+            frame_ids.insert(0, 0)
+        self.__keyframes = array('l', frame_ids)
+
+    def __repr__(self):
+        return f'KeyframeIndex({len(self)})'
+
+    def __len__(self) -> int:
+        return len(self.__keyframes)
+
+    def __contains__(self, frame_id: int) -> bool:
+        idx = bisect.bisect_left(self.__keyframes, frame_id)
+        return idx < len(self.__keyframes) and self.__keyframes[idx] == frame_id
+
+    @property
+    def keyframes(self) -> array:
+        return self.__keyframes
+
+    @property
+    def frame_count(self) -> int:
+        return self.__frame_count
+
+    def keyframe(self, frame_id: int) -> int:
+        """
+        Retorna o keyframe mais próximo à esquerda (inclusive) de `frame_id`.
+
+        Args:
+            frame_id (int): id do frame a ser consultado.
+
+        Returns:
+            int: id do keyframe do GOP ao qual `frame_id` pertence.
+        """
+        if frame_id < 0:
+            raise IndexError(f"frame_id '{frame_id}' must be greater than 0.")
+        idx = bisect.bisect_right(self.__keyframes, frame_id) - 1
+        return self.__keyframes[max(idx, 0)]
+
+    def next_keyframe(self, frame_id: int) -> int | None:
+        """
+        Retorna o keyframe mais próximo à direita (inclusive) de `frame_id`.
+
+        Args:
+            frame_id (int): id do frame a ser consultado.
+
+        Returns:
+            int | None: id do keyframe, ou None caso não exista keyframe após `frame_id`.
+        """
+        idx = bisect.bisect_left(self.__keyframes, frame_id)
+        if idx < len(self.__keyframes):
+            return self.__keyframes[idx]
+        return None
+
+    def same_gop(self, frame_a: int, frame_b: int) -> bool:
+        """Verifica se `frame_a` e `frame_b` pertencem ao mesmo GOP."""
+        return self.keyframe(frame_a) == self.keyframe(frame_b)
+
+    def seek_plan(self, position: int, frame_id: int) -> tuple[int | None, int]:
+        """
+        Planeja o reposicionamento do `VideoCapture` para que o próximo frame lido
+        seja `frame_id`.
+
+        Caso o `VideoCapture` já esteja dentro do GOP de `frame_id` (e antes do mesmo)
+        nenhum seek é necessário, basta avançar com `grab`. Caso contrário, o seek é
+        feito para o keyframe mais próximo à esquerda, limitando o custo de decodificação.
+
+        Args:
+            position (int): posição atual do `VideoCapture`.
+            frame_id (int): frame que deve ser lido em seguida.
+
+        Returns:
+            tuple[int | None, int]
+                - (int | None): frame_id para o qual deve ser feito o seek, ou None se o seek é desnecessário.
+                - (int): número de frames que devem ser descartados com `grab` até chegar em `frame_id`.
+        """
+        keyframe = self.keyframe(frame_id)
+        if keyframe <= position <= frame_id:
+            return None, frame_id - position
+        return keyframe, frame_id - keyframe
+
+    def to_dict(self) -> dict:
+        """Retorna o índice como um dicionário."""
+        return {
+            'FRAME_COUNT': self.__frame_count,
+            'KEYFRAMES': self.__keyframes.tolist()
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'KeyframeIndex':
+        """Cria o índice a partir do dicionário gerado por `to_dict`."""
+        return KeyframeIndex(data['KEYFRAMES'], data['FRAME_COUNT'])
+
+    @staticmethod
+    def scan(cap: VideoCapture) -> 'KeyframeIndex | None':
+        """
+        Percorre todos os pacotes do vídeo sem decodificá-los, registrando os keyframes.
+
+        O `VideoCapture` é colocado em modo "raw" (`CAP_PROP_FORMAT=-1`), o que só é
+        suportado pelo backend do FFmpeg, caso não seja possível None é retornado.
+
+        Args:
+            cap (VideoCapture): captura dedicada ao escaneamento, a mesma não deve ser
+                compartilhada com os buffers.
+
+        Returns:
+            KeyframeIndex | None
+        """
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if not cap.set(cv2.CAP_PROP_FORMAT, -1):
+            logger.debug('the backend does not support raw packets, keyframe index disabled')
+            return None
+
+        keyframes, frame_id = [], 0
+        while frame_id < frame_count and cap.grab():
+            if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                keyframes.append(frame_id)
+            frame_id += 1
+        return KeyframeIndex(keyframes, frame_count)
+
+
+def keyframe_path(file_path: Path) -> Path:
+    """Retorna o caminho do cache do índice de keyframes de um vídeo."""
+    return file_path.with_suffix('.keyframes.json')
+
+
+def load_keyframe_index(file_path: Path, frame_count: int) -> KeyframeIndex | None:
+    """
+    Carrega o índice de keyframes do cache, caso o mesmo não exista (ou esteja
+    desatualizado) o índice é construído e salvo ao lado do vídeo.
+
+    Args:
+        file_path (Path): caminho do vídeo.
+        frame_count (int): número de frames do vídeo.
+
+    Returns:
+        KeyframeIndex | None: None se não for possível construir o índice.
+    """
+    cache = keyframe_path(Path(file_path))
+    try:
+        index = KeyframeIndex.from_dict(JSONReader.read(cache))
+        if index.frame_count == frame_count:
+            return index
+    except (FileNotFoundError, KeyError, ValueError):
+        ...
+
+    cap = cv2.VideoCapture(str(file_path))
+    try:
+        if not cap.isOpened():
+            return None
+        index = KeyframeIndex.scan(cap)
+    finally:
+        cap.release()
+
+    if index is not None:
+        logger.debug(f'saving keyframe index with {len(index)} keyframes')
+        JSONWriter.write(cache, index.to_dict())
+    return index
@@ -8,6 +8,7 @@ from threading import Semaphore
 from gplayer.buffer_left import VideoBufferLeft
 from gplayer.buffer_right import VideoBufferRight
 from gplayer.frame_mapper import FrameMapper
+from gplayer.keyframe import load_keyframe_index
 from gplayer.section import SectionManager
 from gplayer.section_service import SectionService
 from gplayer.player_control import PlayerControl
@@ -17,13 +18,15 @@ from gplayer.utils import VideoInfo
 
 class VideoManager:
 
-    def __init__(self, buffersize, log):
+    def __init__(self, buffersize, log, streaming: bool = False):
         self.__log = log
         self.__buffersize = buffersize
+        self.__streaming = streaming
         self.mapping = None
         self.path = None
         self.trash = None
         self.frame_count = None
+        self.keyframes = None
         self.semaphore = Semaphore()
         self.player = PlayerControl()
         self.__section_manager = None
@@ -51,6 +54,10 @@ class VideoManager:
         self.__cap = cv2.VideoCapture(str(self.path))
         self.frame_count = int(self.__cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
+    def load_keyframes(self, file_path: Path) -> None:
+        """Carrega (ou constrói) o índice de keyframes usado para planejar os seeks."""
+        self.keyframes = load_keyframe_index(file_path, self.frame_count)
+
     def load_section_manager(self, file_path: Path, label: str, file_format: str):
         frame_count = self.frame_count
         file_data = file_path.with_suffix(file_format)
@@ -63,7 +70,7 @@ class VideoManager:
         args = (self.__cap, self.semaphore, self.frame_count)
         if isinstance(self.trash, Trash):
             self.trash._buffer.join_like()
-        self.trash = Trash(*args, buffersize=20)
+        self.trash = Trash(*args, buffersize=20, keyframes=self.keyframes)
         section_manager.load_mementos_frames(self.trash)
 
     def load_player(self, servant: VideoBufferRight, master: VideoBufferLeft):
@@ -71,9 +78,9 @@ class VideoManager:
 
     def load_buffers(self):
         args = (self.__cap, self.mapping, self.semaphore)
-        bsize, log = self.__buffersize, self.__log
-        self.servant = VideoBufferRight(*args, buffersize=bsize, bufferlog=log)
-        self.master = VideoBufferLeft(*args, buffersize=bsize, bufferlog=log)
+        kwargs = {'buffersize': self.__buffersize, 'bufferlog': self.__log, 'keyframes': self.keyframes}
+        self.servant = VideoBufferRight(*args, streaming=self.__streaming, **kwargs)
+        self.master = VideoBufferLeft(*args, **kwargs)
         self.load_player(self.servant, self.master)
 
     def create(self, section_manager: SectionManager):
@@ -86,6 +93,7 @@ class VideoManager:
 
     def open(self, file_path: Path, label: str, file_format: str) -> SectionManager:
         self.load_capture(file_path)
+        self.load_keyframes(file_path)
         section_manager = self.load_section_manager(file_path, label, file_format)
         self.load_mapping(section_manager.get_mapping())
         self.load_trash(section_manager)
@@ -2,18 +2,46 @@ from gplayer.custom_exceptions import VideoOpenError
 from cv2 import VideoCapture
 from time import time
 from gplayer.buffer import Buffer
+from gplayer.keyframe import KeyframeIndex
 
 import cv2
 import traceback
 
 
+def seek_frame(cap: VideoCapture, position: int, frame_id: int, keyframes: KeyframeIndex | None) -> None:
+    """Reposiciona o `VideoCapture` para que o próximo frame lido seja `frame_id`.
+
+        Sem o índice de keyframes o seek é delegado ao OpenCV, caso contrário o seek é
+        planejado a partir do keyframe mais próximo à esquerda de `frame_id`, e evitado
+        quando o `VideoCapture` já estiver dentro do GOP correto.
+
+        Args:
+            cap (VideoCapture): objeto usado para gerar os frames.
+            position (int): posição atual do `VideoCapture`.
+            frame_id (int): id do próximo frame a ser lido.
+            keyframes (KeyframeIndex | None): índice de keyframes do vídeo.
+
+        Returns:
+            None
+    """
+    if keyframes is None:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
+        return
+
+    seek_to, grabs = keyframes.seek_plan(position, frame_id)
+    if seek_to is not None:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, seek_to)
+    for _ in range(grabs):
+        cap.grab()
+
+
 def reader_task(buffer: Buffer, data: tuple) -> None:
     """Função responsável por ler os frames através do modulo da Opencv.
 
         Args:
             cap (VideoCapture): objeto usado para gerar os frames.
             buffer (Buffer): objeto onde os frames serão armazenados.
-            data (tuple[int, int, set]): deve passar como parametro (start_frame, last_frame, mapping_frames)
+            data (tuple): deve passar como parametro (cap, start_frame, last_frame, mapping_frames, keyframes)
 
         Returns:
             None
@@ -23,7 +51,7 @@ def reader_task(buffer: Buffer, data: tuple) -> None:
     # O fluxo principal do programa deve passar o frame_id "start_frame" que
     # define o  frame incial, ja mapping_frames é um set contendo todos os frames a serem lidos.
     buffer.set()
-    cap, start_frame, last_frame, mapping_frames = data
+    cap, start_frame, last_frame, mapping_frames, keyframes = data
     frame_id, qsize = start_frame, 0
     start = time()
 
@@ -34,7 +62,7 @@ def reader_task(buffer: Buffer, data: tuple) -> None:
     if start_frame >= frame_count:
         raise IndexError('start_frame ultrapassou o limite de frames do vídeo.')
     elif check_frame_id != frame_id:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
+        seek_frame(cap, check_frame_id, frame_id, keyframes)
 
     # Bloco onde os frames são lidos e armazenados na fila
     ret = None
@@ -56,7 +84,7 @@ def reader_task(buffer: Buffer, data: tuple) -> None:
         elif frame_id == frame_count:
             # raise IndexError('o video acabou')
             break
-        elif buffer.end_task.is_set():
+        elif buffer.cancelled():
             break
         frame_id += 1
 
@@ -3,6 +3,7 @@ from collections import deque
 from loguru import logger
 from gplayer.buffer_right import VideoBufferRight
 from gplayer.frame_mapper import FrameMapper
+from gplayer.keyframe import KeyframeIndex
 from gplayer.utils import FrameWrapper, FrameStack
 from gplayer.memento import Caretaker, TrashOriginator
 from threading import Semaphore
@@ -10,13 +11,20 @@ from numpy import ndarray
 
 
 class Trash():
-    def __init__(self, cap: VideoCapture, semaphore: Semaphore, frame_count, buffersize=5, bufferlog=False):
+    def __init__(self,
+                 cap: VideoCapture,
+                 semaphore: Semaphore,
+                 frame_count,
+                 buffersize=5,
+                 bufferlog=False,
+                 keyframes: KeyframeIndex = None):
         self.__buffersize = buffersize
         self.__frame_count = frame_count
         self._stack = FrameStack(2 * buffersize)
         self._dframes = dict()
         self._mapping = FrameMapper([], frame_count)
-        self._buffer = VideoBufferRight(cap, self._mapping, semaphore, buffersize=buffersize, bufferlog=bufferlog)
+        self._buffer = VideoBufferRight(cap, self._mapping, semaphore,
+                                        buffersize=buffersize, bufferlog=bufferlog, keyframes=keyframes)
         self._state = None
         self.__caretaker = Caretaker()
         self.__originator = TrashOriginator(self._mapping)
@@ -35,7 +35,8 @@ class VideoCon:
             frames_mapping: list[int] = None,
             section: ISectionManagerAdapter = None,
             buffersize: int = 60,
-            log: bool = False
+            log: bool = False,
+            streaming: bool = False
     ):
 
         self.__playlist = video if isinstance(video, Playlist) else Playlist([video])
@@ -43,7 +44,7 @@ class VideoCon:
         self.__buffersize = buffersize
         self.__creating_window()
 
-        self.__video_manager = VideoManager(buffersize, log)
+        self.__video_manager = VideoManager(buffersize, log, streaming)
         self.__video_controller = VideoController(self.__playlist,
                                                   frames_mapping,
                                                   self.__video_manager)
@@ -99,7 +99,7 @@ class VideoController:
 
     def undo(self):
         if self.__trash.can_undo():
-            self.__player.servant._buffer.end_task.set()
+            self.__player.servant._buffer.cancel()
             self.__player.servant._buffer.wait_task()
             frame_id, frame = self.__trash.undo()
             logger.error(f'frame {frame_id} restored')
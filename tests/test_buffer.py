@@ -1,5 +1,5 @@
 from pytest import fixture
-from gplayer.buffer import FakeBuffer as Buffer
+from gplayer.buffer import BufferState, FakeBuffer as Buffer
 from threading import Semaphore, Thread
 from time import sleep
 import numpy as np
@@ -232,8 +232,9 @@ def test_buffer_do_task_no_block_task_eh_task_is_done_sao_false(buffer):
     expect_task_is_done = False
 
     buffer.set()
-    buffer._wait_task.put(True)  # Para não bloquear os testes
-    [buffer.put(frame) for frame in lote(0, 1, 1)]
+    # O put esperaria o fim da task, que nunca ocorre sem a thread, então
+    # bloqueamos a task manualmente
+    buffer.no_block_task(False)
     result = buffer.do_task()
     result_secondary = buffer.secondary_empty()
     result_no_block_task = buffer.no_block_task()
@@ -342,3 +343,123 @@ def test_buffer_synchronizing_main_thread(buffer):
     result = buffer.task_is_done()
     th.join()
     assert expect == result
+
+
+def test_buffer_estado_inicial(buffer):
+    expect = BufferState.IDLE
+    result = buffer.state
+    assert expect == result
+
+
+def test_buffer_estado_apos_o_set(buffer):
+    expect = BufferState.FILLING
+    buffer.set()
+    result = buffer.state
+    assert expect == result
+
+
+def test_buffer_estado_apos_o_clear_com_o_secondary_cheio(buffer):
+    expect = BufferState.DRAINING
+    buffer.set()
+    [buffer.sput(frame) for frame in lote(0, 5, 1)]
+    buffer.clear()
+    result = buffer.state
+    assert expect == result
+
+
+def test_buffer_estado_apos_o_unqueue(buffer):
+    expect = BufferState.IDLE
+    buffer.set()
+    [buffer.sput(frame) for frame in lote(0, 5, 1)]
+    buffer.clear()
+    buffer.unqueue()
+    result = buffer.state
+    assert expect == result
+
+
+def test_buffer_cancel_durante_a_task(buffer):
+    expect_cancelled = True
+    expect_task_is_done = False
+    buffer.set()
+    buffer.cancel()
+    result_cancelled = buffer.cancelled()
+    result_task_is_done = buffer.task_is_done()
+    assert expect_cancelled == result_cancelled
+    assert expect_task_is_done == result_task_is_done
+
+
+def test_buffer_cancel_sem_task_nao_faz_nada(buffer):
+    expect = BufferState.IDLE
+    buffer.cancel()
+    result = buffer.state
+    assert expect == result
+
+
+def test_buffer_wait_task_espera_o_clear(buffer):
+    expect = True
+
+    def task(buffer):
+        sleep(0.01)
+        buffer.clear()
+    buffer.set()
+    th = Thread(target=task, args=(buffer,))
+    th.start()
+    buffer.wait_task()
+    result = buffer.task_is_done()
+    th.join()
+    assert expect == result
+
+
+def test_buffer_synchronizing_main_thread_com_a_task_ja_concluida(buffer):
+    # A task enviada pode ser concluida antes da thread principal sincronizar,
+    # nesse caso o synchronizing_main_thread não deve bloquear
+    expect = True
+
+    def task(buffer):
+        buffer.recv()
+        buffer.set()
+        buffer.clear()
+    th = Thread(target=task, args=(buffer,))
+    buffer.send((0, 0, 0, set(), None))
+    th.start()
+    th.join()
+    buffer.synchronizing_main_thread()
+    result = buffer.task_is_done()
+    assert expect == result
+
+
+def test_buffer_stream_nao_espera_o_fim_da_task(buffer):
+    expect = [0, 1, 2]
+    buffer.set()
+    [buffer.sput(frame) for frame in lote(0, 3, 1)]
+    buffer.stream()
+    result = [buffer.get()[0] for _ in range(3)]
+    assert expect == result
+    assert buffer.task_is_done() is False
+
+
+def test_buffer_stream_espera_o_proximo_frame(buffer):
+    expect = 0
+
+    def task(buffer):
+        sleep(0.01)
+        buffer.sput((0, None))
+    buffer.set()
+    th = Thread(target=task, args=(buffer,))
+    th.start()
+    buffer.stream()
+    result = buffer.get()[0]
+    th.join()
+    assert expect == result
+
+
+def test_buffer_stream_respeita_o_tamanho_do_buffer(buffer):
+    expect_primary = 25
+    expect_secondary = 5
+    [buffer._primary.append(frame) for frame in lote(0, 20, 1)]
+    [buffer.sput(frame) for frame in lote(20, 30, 1)]
+    buffer.stream()
+    result_primary = len(buffer)
+    result_secondary = buffer._secondary.qsize()
+    assert expect_primary == result_primary
+    assert expect_secondary == result_secondary
@@ -0,0 +1,184 @@
+from gplayer.keyframe import KeyframeIndex, keyframe_path, load_keyframe_index
+from gplayer.reader import seek_frame
+from pathlib import Path
+from pytest import fixture, raises
+
+import cv2
+import numpy as np
+import pytest
+
+
+class MyVideoCapture():
+    def __init__(self, keyframes=None):
+        self.frames = [np.zeros((2, 2)) for x in range(100)]
+        self.keyframes = keyframes
+        self.raw = False
+        self.index = 0
+        self.seeks = []
+        self.grabs = 0
+
+    def read(self):
+        if self.index < len(self.frames):
+            frame = self.frames[self.index]
+            self.index += 1
+            return True, frame
+        return False, None
+
+    def grab(self):
+        if self.index < len(self.frames):
+            self.index += 1
+            self.grabs += 1
+            return True
+        return False
+
+    def set(self, flag, value):
+        if cv2.CAP_PROP_POS_FRAMES == flag:
+            self.seeks.append(value)
+            self.index = value
+            return True
+        elif cv2.CAP_PROP_FORMAT == flag and self.keyframes is not None:
+            self.raw = True
+            return True
+        return False
+
+    def get(self, flag):
+        if cv2.CAP_PROP_FRAME_COUNT == flag:
+            return len(self.frames)
+        elif cv2.CAP_PROP_POS_FRAMES == flag:
+            return self.index
+        elif cv2.CAP_PROP_LRF_HAS_KEY_FRAME == flag:
+            return (self.index - 1) in self.keyframes
+        return False
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        ...
+
+
+@fixture
+def index():
+    yield KeyframeIndex([0, 25, 50, 75], 100)
+
+
+def test_KeyframeIndex_o_frame_0_sempre_e_keyframe():
+    expect = [0, 30, 60]
+    result = KeyframeIndex([60, 30], 100).keyframes.tolist()
+    assert expect == result
+
+
+def test_KeyframeIndex_ignora_keyframes_fora_do_video():
+    expect = [0, 30]
+    result = KeyframeIndex([30, 100, 150], 100).keyframes.tolist()
+    assert expect == result
+
+
+@pytest.mark.parametrize('frame_id,expect', [(0, 0), (24, 0), (25, 25), (49, 25), (99, 75)])
+def test_KeyframeIndex_keyframe(index, frame_id, expect):
+    result = index.keyframe(frame_id)
+    assert expect == result
+
+
+def test_KeyframeIndex_keyframe_com_frame_id_negativo(index):
+    with raises(IndexError):
+        index.keyframe(-1)
+
+
+@pytest.mark.parametrize('frame_id,expect', [(0, 0), (1, 25), (25, 25), (76, None)])
+def test_KeyframeIndex_next_keyframe(index, frame_id, expect):
+    result = index.next_keyframe(frame_id)
+    assert expect == result
+
+
+def test_KeyframeIndex_contains(index):
+    assert 50 in index
+    assert 51 not in index
+
+
+def test_KeyframeIndex_same_gop(index):
+    assert index.same_gop(26, 49) is True
+    assert index.same_gop(24, 25) is False
+
+
+def test_KeyframeIndex_seek_plan_dentro_do_gop(index):
+    expect = (None, 10)
+    result = index.seek_plan(30, 40)
+    assert expect == result
+
+
+def test_KeyframeIndex_seek_plan_fora_do_gop(index):
+    expect = (25, 15)
+    result = index.seek_plan(10, 40)
+    assert expect == result
+
+
+def test_KeyframeIndex_seek_plan_com_o_frame_a_esquerda_da_posicao(index):
+    expect = (25, 5)
+    result = index.seek_plan(40, 30)
+    assert expect == result
+
+
+def test_KeyframeIndex_to_dict_from_dict(index):
+    expect = index.keyframes.tolist()
+    result = KeyframeIndex.from_dict(index.to_dict()).keyframes.tolist()
+    assert expect == result
+
+
+def test_KeyframeIndex_scan():
+    expect = [0, 10, 20, 90]
+    cap = MyVideoCapture(keyframes={0, 10, 20, 90})
+    result = KeyframeIndex.scan(cap).keyframes.tolist()
+    assert expect == result
+
+
+def test_KeyframeIndex_scan_sem_suporte_ao_modo_raw():
+    expect = None
+    result = KeyframeIndex.scan(MyVideoCapture())
+    assert expect == result
+
+
+def test_seek_frame_sem_indice():
+    cap = MyVideoCapture()
+    seek_frame(cap, 0, 40, None)
+    assert cap.seeks == [40]
+    assert cap.grabs == 0
+
+
+def test_seek_frame_dentro_do_gop(index):
+    cap = MyVideoCapture()
+    cap.index = 30
+    seek_frame(cap, 30, 40, index)
+    assert cap.seeks == []
+    assert cap.index == 40
+
+
+def test_seek_frame_fora_do_gop(index):
+    cap = MyVideoCapture()
+    seek_frame(cap, 0, 40, index)
+    assert cap.seeks == [25]
+    assert cap.index == 40
+
+
+def test_keyframe_path():
+    expect = Path('video-01.keyframes.json')
+    result = keyframe_path(Path('video-01.mp4'))
+    assert expect == result
+
+
+def test_load_keyframe_index_cria_o_cache(tmp_path):
+    video_path = tmp_path / 'video.avi'
+    writer = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*'MJPG'), 24, (32, 24))
+    if not writer.isOpened():
+        pytest.skip('VideoWriter is not available')
+    for value in range(30):
+        writer.write(np.full((24, 32, 3), value, dtype=np.uint8))
+    writer.release()
+
+    index = load_keyframe_index(video_path, 30)
+    if index is None:
+        pytest.skip('the backend does not support raw packets')
+
+    assert keyframe_path(video_path).exists()
+    result = load_keyframe_index(video_path, 30).keyframes.tolist()
+    assert index.keyframes.tolist() == result
@@ -2,6 +2,7 @@ from pytest import fixture
 from gplayer.buffer_left import VideoBufferLeft
 from gplayer.custom_exceptions import VideoBufferError
 from gplayer.frame_mapper import FrameMapper
+from gplayer.keyframe import KeyframeIndex
 from pytest import raises
 from unittest.mock import patch
 from time import sleep
@@ -85,6 +86,20 @@ def myvideo_mapping(mycap, request):
     buffer.join()
 
 
+@fixture
+def myvideo_keyframes(mycap, request):
+    lote, buffersize, keyframes = request.param
+    cap = mycap.return_value
+    semaphore = Semaphore()
+    frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+    mapping = FrameMapper(lote, frame_count)
+    index = KeyframeIndex(keyframes, frame_count)
+    buffer = VideoBufferLeft(cap, mapping, semaphore, buffersize=buffersize, keyframes=index)
+    yield buffer
+
+    buffer.join()
+
+
 # ################### Testes para o VideoBufferLeft sem Frames ##################################333
 
 @pytest.mark.parametrize('myvideo', [([], 5)], indirect=True)
@@ -1012,3 +1027,40 @@ def test_buffer_VideoBufferLeft_com_buffer_vazio_apos_um_get(myvideo):
     result_end_frame = myvideo.end_frame()
     assert result_start_frame == expect_start_frame
     assert result_end_frame == expect_end_frame
+
+
+# #################### TESTES PARA O REWIND ALINHADO COM O GOP ##################################
+
+@pytest.mark.parametrize('myvideo_keyframes', [(list(range(200)), 25, [0, 60, 120, 180])], indirect=True)
+def test_buffer_VideoBufferLeft_start_frame_alinhado_com_o_keyframe(myvideo_keyframes):
+    expect_start_frame = 60
+    expect_end_frame = 74
+    myvideo_keyframes.set(75)
+    result_start_frame = myvideo_keyframes.start_frame()
+    result_end_frame = myvideo_keyframes.end_frame()
+    assert result_start_frame == expect_start_frame
+    assert result_end_frame == expect_end_frame
+
+
+@pytest.mark.parametrize('myvideo_keyframes', [(list(range(200)), 25, [0, 100])], indirect=True)
+def test_buffer_VideoBufferLeft_start_frame_com_gop_maior_que_o_buffer(myvideo_keyframes):
+    expect = 50
+    myvideo_keyframes.set(75)
+    result = myvideo_keyframes.start_frame()
+    assert result == expect
+
+
+@pytest.mark.parametrize('myvideo_keyframes', [(list(range(0, 200, 7)), 25, [0, 60, 120])], indirect=True)
+def test_buffer_VideoBufferLeft_start_frame_alinhado_com_mapping_nao_linear(myvideo_keyframes):
+    expect = 63
+    myvideo_keyframes.set(195)
+    result = myvideo_keyframes.start_frame()
+    assert result == expect
+
+
+@pytest.mark.parametrize('myvideo_keyframes', [(list(range(200)), 25, [0, 20, 40, 60])], indirect=True)
+def test_buffer_VideoBufferLeft_rewind_percorre_os_gops(myvideo_keyframes):
+    expect = list(range(79, -1, -1))
+    myvideo_keyframes.set(80)
+    result = [myvideo_keyframes.get()[0] for _ in range(80)]
+    assert result == expect
@@ -83,6 +83,20 @@ def myvideo_mapping(mycap, request):
     buffer.join()
 
 
+@fixture
+def myvideo_streaming(mycap, request):
+    lote, buffersize, low_watermark = request.param
+    cap = mycap.return_value
+    semaphore = Semaphore()
+    frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+    mapping = FrameMapper(lote, frame_count)
+    buffer = VideoBufferRight(cap, mapping, semaphore, buffersize=buffersize,
+                              streaming=True, low_watermark=low_watermark)
+    yield buffer
+
+    buffer.join()
+
+
 # ################### Testes para o VideoBufferRight sem Frames ##################################333
 
 @pytest.mark.parametrize('myvideo', [([], 5)], indirect=True)
@@ -924,3 +938,51 @@ def test_buffer_VideoBufferRight_com_buffer_vazio_apos_um_get(myvideo):
     result_end_frame = myvideo.end_frame()
     assert result_start_frame == expect_start_frame
     assert result_end_frame == expect_end_frame
+
+
+# ##################### TESTES PARA O MODO STREAMING #############################################
+
+@pytest.mark.parametrize('myvideo_streaming', [(list(range(100)), 25, 10)], indirect=True)
+def test_buffer_VideoBufferRight_streaming_consumindo_tudo(myvideo_streaming):
+    expect = list(range(100))
+    result = [myvideo_streaming.get()[0] for _ in range(100)]
+    assert result == expect
+
+
+@pytest.mark.parametrize('myvideo_streaming', [(list(range(0, 300, 3)), 25, 10)], indirect=True)
+def test_buffer_VideoBufferRight_streaming_consumindo_tudo_nao_linear(myvideo_streaming):
+    expect = list(range(0, 300, 3))
+    result = [myvideo_streaming.get()[0] for _ in range(100)]
+    assert result == expect
+
+
+@pytest.mark.parametrize('myvideo_streaming', [(list(range(100)), 25, 10)], indirect=True)
+def test_buffer_VideoBufferRight_streaming_do_task_acima_do_low_watermark(myvideo_streaming):
+    expect = False
+    [myvideo_streaming._buffer._primary.append(frame) for frame in lote(0, 11)]
+    result = myvideo_streaming.do_task()
+    assert result == expect
+
+
+@pytest.mark.parametrize('myvideo_streaming', [(list(range(100)), 25, 10)], indirect=True)
+def test_buffer_VideoBufferRight_streaming_do_task_no_low_watermark(myvideo_streaming):
+    expect = True
+    [myvideo_streaming._buffer._primary.append(frame) for frame in lote(0, 10)]
+    result = myvideo_streaming.do_task()
+    assert result == expect
+
+
+@pytest.mark.parametrize('myvideo_streaming', [(list(range(100)), 25, None)], indirect=True)
+def test_buffer_VideoBufferRight_streaming_low_watermark_padrao(myvideo_streaming):
+    expect = 12
+    result = myvideo_streaming.low_watermark
+    assert result == expect
+
+
+@pytest.mark.parametrize('myvideo_streaming', [(list(range(100)), 25, 10)], indirect=True)
+def test_buffer_VideoBufferRight_streaming_set_no_meio_da_leitura(myvideo_streaming):
+    expect = list(range(60, 70))
+    [myvideo_streaming.get() for _ in range(15)]
+    myvideo_streaming.set(60)
+    result = [myvideo_streaming.get()[0] for _ in range(10)]
+    assert result == expect